@@ -10,9 +10,15 @@ import me.rerere.document.DocxParser
 import me.rerere.document.EpubParser
 import me.rerere.document.PdfParser
 import me.rerere.document.PptxParser
+import me.rerere.rikkahub.data.files.DocumentTextCache
+import org.koin.core.component.KoinComponent
+import org.koin.core.component.get
 import java.io.File
 
-object DocumentAsPromptTransformer : InputMessageTransformer {
+object DocumentAsPromptTransformer : InputMessageTransformer, KoinComponent {
+    // 每次发送都会重新转换整段历史, 解析结果交给 DocumentTextCache 复用
+    private val textCache by lazy { get<DocumentTextCache>() }
+
     override suspend fun transform(
         ctx: TransformerContext,
         messages: List<UIMessage>,
@@ -67,6 +73,8 @@ object DocumentAsPromptTransformer : InputMessageTransformer {
         return "/upload/${file.name}"
     }
 
+    private fun File.cachedParse(parse: (File) -> String): String = textCache.getOrParse(this, parse)
+
     private fun readDocumentContent(document: UIMessagePart.Document): String {
         val file = runCatching { document.url.toUri().toFile() }.getOrNull()
             ?: return "[ERROR, invalid file uri: ${document.fileName}]"
@@ -75,10 +83,12 @@ object DocumentAsPromptTransformer : InputMessageTransformer {
         }
         return runCatching {
             when (document.mime) {
-                "application/pdf" -> parsePdfAsText(file)
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document" -> parseDocxAsText(file)
-                "application/vnd.openxmlformats-officedocument.presentationml.presentation" -> parsePptxAsText(file)
-                "application/epub+zip" -> parseEpubAsText(file)
+                "application/pdf" -> file.cachedParse(::parsePdfAsText)
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document" ->
+                    file.cachedParse(::parseDocxAsText)
+                "application/vnd.openxmlformats-officedocument.presentationml.presentation" ->
+                    file.cachedParse(::parsePptxAsText)
+                "application/epub+zip" -> file.cachedParse(::parseEpubAsText)
                 else -> file.readText()
             }
         }.getOrElse {
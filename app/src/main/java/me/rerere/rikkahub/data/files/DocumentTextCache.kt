@@ -0,0 +1,102 @@
+package me.rerere.rikkahub.data.files
+
+import kotlinx.serialization.Serializable
+import kotlinx.serialization.builtins.serializer
+import me.rerere.common.cache.Base64JsonKeyCodec
+import me.rerere.common.cache.LruCache
+import me.rerere.common.cache.PerKeyFileCacheStore
+import java.io.File
+import kotlin.time.Duration.Companion.days
+
+@Serializable
+private data class CachedDocumentText(
+    val sizeBytes: Long,
+    val modifiedAt: Long,
+    val text: String,
+)
+
+/**
+ * 文档解析结果缓存, 按文件绝对路径索引, 命中时再比对大小和修改时间
+ */
+class DocumentTextCache(
+    private val dir: File,
+    private val memoryCapacity: Int = 4,
+    private val diskCapacity: Int = 64,
+    private val ttlMillis: Long = 7.days.inWholeMilliseconds,
+) {
+    companion object {
+        private const val EXT = ".json"
+
+        private val DOCUMENT_MIME_TYPES = setOf(
+            "application/pdf",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            "application/epub+zip",
+        )
+
+        fun isDocumentMime(mime: String?): Boolean = mime in DOCUMENT_MIME_TYPES
+    }
+
+    private val keyCodec = Base64JsonKeyCodec(String.serializer())
+
+    private val store = PerKeyFileCacheStore(
+        dir = dir,
+        keyCodec = keyCodec,
+        valueSerializer = CachedDocumentText.serializer(),
+    )
+
+    // 内存层只保留少量最近文档, 其余由磁盘层兜底
+    // 初始化时清理上次进程遗留的过期/失效条目
+    private val cacheDelegate = lazy {
+        sweepStore()
+        LruCache(
+            capacity = memoryCapacity,
+            store = store,
+            expireAfterWriteMillis = ttlMillis,
+        )
+    }
+    private val cache by cacheDelegate
+
+    fun getOrParse(file: File, parse: (File) -> String): String {
+        val key = file.absolutePath
+        val sizeBytes = file.length()
+        val modifiedAt = file.lastModified()
+        cache.get(key)
+            ?.takeIf { it.sizeBytes == sizeBytes && it.modifiedAt == modifiedAt }
+            ?.let { return it.text }
+        val text = parse(file)
+        cache.put(key, CachedDocumentText(sizeBytes, modifiedAt, text))
+        // 内存层淘汰时不删磁盘文件, 每次写入后按容量裁剪磁盘层
+        sweepStore()
+        return text
+    }
+
+    fun evict(file: File) {
+        val key = file.absolutePath
+        runCatching {
+            if (cacheDelegate.isInitialized()) cache.remove(key) else store.remove(key)
+        }
+    }
+
+    fun clear() {
+        runCatching {
+            if (cacheDelegate.isInitialized()) cache.clear() else store.clear()
+        }
+    }
+
+    // 只看文件名和修改时间 (即写入时间), 不解码缓存内容
+    private fun sweepStore() = runCatching {
+        val now = System.currentTimeMillis()
+        val alive = dir.listFiles { file -> file.isFile && file.name.endsWith(EXT) }
+            .orEmpty()
+            .filter { file ->
+                val source = keyCodec.fromFileName(file.name.removeSuffix(EXT))?.let(::File)
+                val valid = source != null && source.isFile && file.lastModified() + ttlMillis > now
+                if (!valid) file.delete()
+                valid
+            }
+        alive.sortedByDescending { it.lastModified() }
+            .drop(diskCapacity)
+            .forEach { it.delete() }
+    }
+}
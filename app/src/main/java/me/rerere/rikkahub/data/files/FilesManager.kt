@@ -30,6 +30,7 @@ class FilesManager(
     private val context: Context,
     private val repository: FilesRepository,
     private val appScope: AppScope,
+    private val documentTextCache: DocumentTextCache,
 ) {
     companion object {
         private const val TAG = "FilesManager"
@@ -206,9 +207,14 @@ class FilesManager(
         uris.filter { it.toString().startsWith("file:") }.forEach { uri ->
             val file = uri.toFile()
             getRelativePathInFilesDir(file)?.let { relativePaths.add(it) }
+            // 删除前判断类型, 只有文档才有解析缓存
+            val isDocument = DocumentTextCache.isDocumentMime(guessMimeType(file, file.name))
             if (file.exists()) {
                 file.delete()
             }
+            if (isDocument) {
+                documentTextCache.evict(file)
+            }
         }
         if (relativePaths.isNotEmpty()) {
             appScope.launch(Dispatchers.IO) {
@@ -372,7 +378,11 @@ class FilesManager(
     suspend fun delete(id: Long, deleteFromDisk: Boolean = true): Boolean = withContext(Dispatchers.IO) {
         val entity = repository.getById(id) ?: return@withContext false
         if (deleteFromDisk) {
-            runCatching { getFile(entity).delete() }
+            val file = getFile(entity)
+            runCatching { file.delete() }
+            if (DocumentTextCache.isDocumentMime(entity.mimeType)) {
+                documentTextCache.evict(file)
+            }
         }
         repository.deleteById(id) > 0
     }
@@ -392,6 +402,10 @@ class FilesManager(
         }
 
         if (allDeletedFromDisk) {
+            // 部分删除失败时不清空, 已删除文件的条目会在下次清理时因源文件不存在而移除
+            if (folder == FileFolders.UPLOAD) {
+                documentTextCache.clear()
+            }
             repository.deleteByFolder(folder)
             return@withContext true
         }
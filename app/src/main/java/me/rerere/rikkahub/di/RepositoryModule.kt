@@ -1,6 +1,7 @@
 package me.rerere.rikkahub.di
 
 import android.content.Context
+import me.rerere.rikkahub.data.files.DocumentTextCache
 import me.rerere.rikkahub.data.files.FileFolders
 import me.rerere.rikkahub.data.files.FilesManager
 import me.rerere.rikkahub.data.files.SkillManager
@@ -76,7 +77,12 @@ val repositoryModule = module {
     }
 
     single {
-        FilesManager(get(), get(), get())
+        val context: Context = get()
+        DocumentTextCache(dir = File(context.cacheDir, "document_text_cache"))
+    }
+
+    single {
+        FilesManager(get(), get(), get(), get())
     }
 
     single {
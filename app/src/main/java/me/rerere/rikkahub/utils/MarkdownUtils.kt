@@ -1,5 +1,20 @@
 package me.rerere.rikkahub.utils
 
+private val CODE_REGEX = Regex("```[\\s\\S]*?```|`[^`]*?`")
+private val LINK_REGEX = Regex("!?\\[([^\\]]+)\\]\\([^\\)]*\\)")
+private val BOLD_REGEX = Regex("\\*\\*([^*]+?)\\*\\*")
+private val ITALIC_REGEX = Regex("\\*([^*]+?)\\*")
+private val UNDERLINE_BOLD_REGEX = Regex("__([^_]+?)__")
+private val UNDERLINE_ITALIC_REGEX = Regex("_([^_]+?)_")
+private val STRIKETHROUGH_REGEX = Regex("~~([^~]+?)~~")
+private val HEADING_REGEX = Regex("(?m)^#+\\s*")
+private val UNORDERED_LIST_REGEX = Regex("(?m)^\\s*[-*+]\\s+")
+private val ORDERED_LIST_REGEX = Regex("(?m)^\\s*\\d+\\.\\s+")
+private val QUOTE_REGEX = Regex("(?m)^>\\s*")
+private val HORIZONTAL_RULE_REGEX = Regex("(?m)^(\\s*[-*_]){3,}\\s*$")
+private val EXTRA_NEWLINES_REGEX = Regex("\n{3,}")
+private val BOLD_LINE_REGEX = Regex("^\\*\\*(.+?)\\*\\*$")
+
 /**
  * 移除字符串中的Markdown格式
  * @return 移除Markdown格式后的纯文本
@@ -7,28 +22,28 @@ package me.rerere.rikkahub.utils
 fun String.stripMarkdown(): String {
     return this
         // 移除代码块 (```...``` 和 `...`)
-        .replace(Regex("```[\\s\\S]*?```|`[^`]*?`"), "")
+        .replace(CODE_REGEX, "")
         // 移除图片和链接，但保留其文本内容
-        .replace(Regex("!?\\[([^\\]]+)\\]\\([^\\)]*\\)"), "$1")
+        .replace(LINK_REGEX, "$1")
         // 移除加粗和斜体 (先处理两个星号的)
-        .replace(Regex("\\*\\*([^*]+?)\\*\\*"), "$1")
-        .replace(Regex("\\*([^*]+?)\\*"), "$1")
+        .replace(BOLD_REGEX, "$1")
+        .replace(ITALIC_REGEX, "$1")
         // 移除下划线
-        .replace(Regex("__([^_]+?)__"), "$1")
-        .replace(Regex("_([^_]+?)_"), "$1")
+        .replace(UNDERLINE_BOLD_REGEX, "$1")
+        .replace(UNDERLINE_ITALIC_REGEX, "$1")
         // 移除删除线
-        .replace(Regex("~~([^~]+?)~~"), "$1")
+        .replace(STRIKETHROUGH_REGEX, "$1")
         // 移除标题标记 (多行模式)
-        .replace(Regex("(?m)^#+\\s*"), "")
+        .replace(HEADING_REGEX, "")
         // 移除列表标记 (多行模式)
-        .replace(Regex("(?m)^\\s*[-*+]\\s+"), "")
-        .replace(Regex("(?m)^\\s*\\d+\\.\\s+"), "")
+        .replace(UNORDERED_LIST_REGEX, "")
+        .replace(ORDERED_LIST_REGEX, "")
         // 移除引用标记 (多行模式)
-        .replace(Regex("(?m)^>\\s*"), "")
+        .replace(QUOTE_REGEX, "")
         // 移除水平分割线
-        .replace(Regex("(?m)^(\\s*[-*_]){3,}\\s*$"), "")
+        .replace(HORIZONTAL_RULE_REGEX, "")
         // 将多个换行符压缩，以保留段落
-        .replace(Regex("\n{3,}"), "\n\n")
+        .replace(EXTRA_NEWLINES_REGEX, "\n\n")
         .trim()
 }
 
@@ -41,8 +56,7 @@ fun String.extractThinkingTitle(): String? {
         val line = lines[i].trim()
 
         // 检查是否为加粗格式且独占一整行
-        val boldPattern = Regex("^\\*\\*(.+?)\\*\\*$")
-        val match = boldPattern.find(line)
+        val match = BOLD_LINE_REGEX.find(line)
 
         if (match != null) {
             // 返回加粗标记内的文本内容
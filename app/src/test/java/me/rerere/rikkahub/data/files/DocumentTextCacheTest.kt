@@ -0,0 +1,104 @@
+package me.rerere.rikkahub.data.files
+
+import org.junit.Assert.assertEquals
+import org.junit.Assert.assertFalse
+import org.junit.Assert.assertTrue
+import org.junit.Rule
+import org.junit.Test
+import org.junit.rules.TemporaryFolder
+import java.io.File
+
+class DocumentTextCacheTest {
+    @get:Rule
+    val temporaryFolder = TemporaryFolder()
+
+    private val cacheDir: File
+        get() = temporaryFolder.root.resolve("document_text_cache")
+
+    private fun cachedFiles(): List<File> =
+        cacheDir.listFiles { file -> file.name.endsWith(".json") }.orEmpty().toList()
+
+    @Test
+    fun `returns cached text for unchanged file`() {
+        val document = temporaryFolder.newFile("a.pdf").apply { writeText("v1") }
+        val cache = DocumentTextCache(cacheDir)
+        var parses = 0
+
+        val first = cache.getOrParse(document) { parses++; "text-${it.readText()}" }
+        val second = cache.getOrParse(document) { parses++; "text-${it.readText()}" }
+
+        assertEquals("text-v1", first)
+        assertEquals("text-v1", second)
+        assertEquals(1, parses)
+    }
+
+    @Test
+    fun `reparses after file size or mtime changes`() {
+        val document = temporaryFolder.newFile("a.pdf").apply { writeText("v1") }
+        val cache = DocumentTextCache(cacheDir)
+        var parses = 0
+        cache.getOrParse(document) { parses++; it.readText() }
+
+        document.writeText("version 2")
+        document.setLastModified(document.lastModified() + 10_000)
+
+        assertEquals("version 2", cache.getOrParse(document) { parses++; it.readText() })
+        assertEquals(2, parses)
+    }
+
+    @Test
+    fun `reads entries persisted by a previous instance`() {
+        val document = temporaryFolder.newFile("a.pdf").apply { writeText("v1") }
+        DocumentTextCache(cacheDir).getOrParse(document) { "parsed" }
+
+        val text = DocumentTextCache(cacheDir).getOrParse(document) { error("should hit disk cache") }
+
+        assertEquals("parsed", text)
+    }
+
+    @Test
+    fun `sweep drops entries whose source file is gone`() {
+        val kept = temporaryFolder.newFile("kept.pdf").apply { writeText("kept") }
+        val removed = temporaryFolder.newFile("removed.pdf").apply { writeText("removed") }
+        DocumentTextCache(cacheDir).apply {
+            getOrParse(kept) { it.readText() }
+            getOrParse(removed) { it.readText() }
+        }
+        assertEquals(2, cachedFiles().size)
+
+        assertTrue(removed.delete())
+        DocumentTextCache(cacheDir).getOrParse(kept) { error("should hit disk cache") }
+
+        assertEquals(1, cachedFiles().size)
+    }
+
+    @Test
+    fun `trims disk tier to capacity while running`() {
+        val cache = DocumentTextCache(cacheDir, memoryCapacity = 1, diskCapacity = 2)
+
+        repeat(5) { index ->
+            val document = temporaryFolder.newFile("doc$index.pdf").apply { writeText("$index") }
+            cache.getOrParse(document) { it.readText() }
+        }
+
+        assertEquals(2, cachedFiles().size)
+    }
+
+    @Test
+    fun `evict removes persisted entry`() {
+        val document = temporaryFolder.newFile("a.pdf").apply { writeText("v1") }
+        val cache = DocumentTextCache(cacheDir)
+        cache.getOrParse(document) { it.readText() }
+
+        cache.evict(document)
+
+        assertTrue(cachedFiles().isEmpty())
+    }
+
+    @Test
+    fun `only document mime types are cached`() {
+        assertTrue(DocumentTextCache.isDocumentMime("application/pdf"))
+        assertFalse(DocumentTextCache.isDocumentMime("image/png"))
+        assertFalse(DocumentTextCache.isDocumentMime(null))
+    }
+}
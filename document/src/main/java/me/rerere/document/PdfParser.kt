@@ -6,15 +6,29 @@ import java.io.File
 object PdfParser {
     fun parserPdf(file: File): String {
         val document = PDFDocument.openDocument(file.absolutePath).asPDF()
-        val pages = document.countPages()
-        val result = StringBuilder()
-        for (i in 0 until pages) {
-            val page = document.loadPage(i).toStructuredText()
-            result.append("---")
-            result.append("Page ${i + 1}:\n")
-            result.append(page.asText())
-            result.appendLine()
+        try {
+            val pages = document.countPages()
+            val result = StringBuilder()
+            for (i in 0 until pages) {
+                // 逐页释放 native 对象, 否则大 PDF 的所有页面会一直留在 native 堆上直到 GC
+                val page = document.loadPage(i)
+                try {
+                    val text = page.toStructuredText()
+                    try {
+                        result.append("---")
+                        result.append("Page ${i + 1}:\n")
+                        result.append(text.asText())
+                        result.appendLine()
+                    } finally {
+                        text.destroy()
+                    }
+                } finally {
+                    page.destroy()
+                }
+            }
+            return result.toString()
+        } finally {
+            document.destroy()
         }
-        return result.toString()
     }
 }
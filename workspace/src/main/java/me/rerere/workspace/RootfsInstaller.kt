@@ -104,6 +104,8 @@ class RootfsInstaller(
         format: ArchiveFormat = ArchiveFormat.fromFile(archive),
         onProgress: (RootfsInstallProgress) -> Unit,
     ) {
+        // 解压 rootfs 时条目数以万计, 目标根目录只规范化一次, 逐条目只规范化条目自身路径
+        val rootDir = targetDir.canonicalFile
         format.wrapStream(BufferedInputStream(archive.inputStream())).use { input ->
             var entries = 0
             var pendingName: String? = null
@@ -138,12 +140,12 @@ class RootfsInstaller(
                     input.skipFully(header.size.paddingSize())
                     continue
                 }
-                val target = targetDir.safeResolve(header.name)
+                val target = rootDir.safeResolve(header.name)
                 target.parentFile?.mkdirs()
                 when (header.type) {
                     TarEntryType.DIRECTORY -> target.mkdirs()
-                    TarEntryType.SYMLINK -> createSymlink(targetDir, target, header.linkName)
-                    TarEntryType.HARDLINK -> createHardLink(targetDir, target, header.linkName)
+                    TarEntryType.SYMLINK -> createSymlink(rootDir, target, header.linkName)
+                    TarEntryType.HARDLINK -> createHardLink(rootDir, target, header.linkName)
                     TarEntryType.FILE -> {
                         target.outputStream().use { output ->
                             input.copyExactly(output, header.size)
@@ -183,8 +185,7 @@ class RootfsInstaller(
             File(linkName)
         } else {
             val resolved = File(target.parentFile ?: root, linkName).canonicalFile
-            val rootFile = root.canonicalFile
-            require(resolved.path == rootFile.path || resolved.path.startsWith(rootFile.path + File.separator)) {
+            require(resolved.path == root.path || resolved.path.startsWith(root.path + File.separator)) {
                 "Symlink escapes rootfs: ${target.name}"
             }
             (target.parentFile ?: root).toPath().relativize(resolved.toPath()).toFile()
@@ -316,11 +317,11 @@ class RootfsInstaller(
         return offset
     }
 
+    // 接收者必须已是 canonicalFile, 由 extractTar 在循环外预先计算
     private fun File.safeResolve(path: String): File {
         val normalized = normalizeTarPath(path)
-        val root = canonicalFile
-        val target = File(root, normalized).canonicalFile
-        require(target.path == root.path || target.path.startsWith(root.path + File.separator)) {
+        val target = File(this, normalized).canonicalFile
+        require(target.path == this.path || target.path.startsWith(this.path + File.separator)) {
             "Rootfs entry escapes target directory: $path"
         }
         return target
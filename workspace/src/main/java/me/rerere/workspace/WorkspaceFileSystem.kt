@@ -7,6 +7,7 @@ import java.nio.charset.StandardCharsets
 import java.nio.file.FileSystems
 import java.nio.file.Files
 import java.nio.file.Path
+import java.nio.file.attribute.BasicFileAttributes
 import kotlin.io.path.name
 
 class WorkspaceFileSystem(
@@ -16,12 +17,18 @@ class WorkspaceFileSystem(
         val dir = resolvePath(root, path)
         require(dir.exists()) { "Path does not exist: $path" }
         require(dir.isDirectory) { "Path is not a directory: $path" }
+        val canonicalRoot = root.canonicalFile
+        // 每个条目只读一次属性, 排序和构造 entry 复用同一份, 避免对同一文件反复 stat
         return dir.listFiles()
             .orEmpty()
             .filter { !it.name.startsWith(".l2s.") }
-            .sortedWith(compareBy<File> { !it.isDirectory }.thenBy { it.name.lowercase() })
+            .map { it to it.readAttributes() }
+            .sortedWith(
+                compareBy<Pair<File, BasicFileAttributes?>> { (_, attrs) -> attrs?.isDirectory != true }
+                    .thenBy { (file, _) -> file.name.lowercase() }
+            )
             .take(config.maxListEntries)
-            .map { it.toEntry(root) }
+            .map { (file, attrs) -> file.toEntry(canonicalRoot, attrs) }
     }
 
     fun readText(root: File, path: String, charset: Charset = StandardCharsets.UTF_8): String {
@@ -45,12 +52,21 @@ class WorkspaceFileSystem(
         require(bytes.size <= config.maxWriteBytes) {
             "Content is too large to write: ${bytes.size} bytes"
         }
-        val file = resolvePath(root, path)
+        root.mkdirs()
+        val canonicalRoot = root.canonicalFile
+        val file = resolveCanonicalPath(canonicalRoot, path)
         require(!file.exists() || overwrite) { "File already exists: $path" }
         require(!file.exists() || file.isFile) { "Path is not a file: $path" }
         file.parentFile?.mkdirs()
         file.writeBytes(bytes)
-        return file.toEntry(root)
+        // 刚写入的一定是普通文件, 大小即字节数, 只需再取一次修改时间
+        return WorkspaceFileEntry(
+            path = file.canonicalRelativePath(canonicalRoot),
+            name = file.name,
+            isDirectory = false,
+            sizeBytes = bytes.size.toLong(),
+            updatedAt = file.lastModified(),
+        )
     }
 
     fun importBytes(root: File, path: String, inputStream: InputStream): WorkspaceFileEntry {
@@ -107,13 +123,21 @@ class WorkspaceFileSystem(
         val start = resolvePath(root, path)
         require(start.exists()) { "Path does not exist: $path" }
         val matcher = FileSystems.getDefault().getPathMatcher("glob:$pattern")
+        // walk 产出的是规范化路径, relativize 的基准也需规范化, 并只在遍历前计算一次
+        val canonicalRoot = root.canonicalFile
+        val rootPath = canonicalRoot.toPath()
         return walk(start) { paths ->
             paths
-                .filter { Files.isRegularFile(it) || Files.isDirectory(it) }
                 .filter { !it.toFile().name.startsWith(".l2s.") }
-                .filter { matcher.matches(root.toPath().relativize(it).normalizeForMatch()) }
+                .filter { matcher.matches(rootPath.relativize(it).normalizeForMatch()) }
+                // 先做纯路径匹配, 只对命中的条目读一次属性, 类型判断与构造 entry 共用
+                .mapNotNull { path ->
+                    val file = path.toFile()
+                    val attrs = file.readAttributes() ?: return@mapNotNull null
+                    if (!attrs.isRegularFile && !attrs.isDirectory) return@mapNotNull null
+                    file.toEntry(canonicalRoot, attrs)
+                }
                 .take(config.maxListEntries)
-                .map { it.toFile().toEntry(root) }
                 .toList()
         }
     }
@@ -134,6 +158,7 @@ class WorkspaceFileSystem(
         val includeMatcher = includeGlob
             ?.takeIf { it.isNotBlank() }
             ?.let { FileSystems.getDefault().getPathMatcher("glob:$it") }
+        val rootPath = root.canonicalFile.toPath()
 
         val results = mutableListOf<WorkspaceSearchMatch>()
         walk(start) { paths ->
@@ -143,7 +168,7 @@ class WorkspaceFileSystem(
                 .forEach { path ->
                     if (results.size >= config.maxSearchResults) return@forEach
                     if (includeMatcher != null &&
-                        !includeMatcher.matches(root.toPath().relativize(path).normalizeForMatch())
+                        !includeMatcher.matches(rootPath.relativize(path).normalizeForMatch())
                     ) {
                         return@forEach
                     }
@@ -173,6 +198,10 @@ class WorkspaceFileSystem(
 
     private fun resolvePath(root: File, path: String): File {
         root.mkdirs()
+        return resolveCanonicalPath(root.canonicalFile, path)
+    }
+
+    private fun resolveCanonicalPath(rootFile: File, path: String): File {
         val normalized = path
             .replace('\\', '/')
             .trim()
@@ -180,7 +209,6 @@ class WorkspaceFileSystem(
             .ifBlank { "." }
         require(!normalized.contains('\u0000')) { "Path contains invalid character" }
 
-        val rootFile = root.canonicalFile
         val target = if (normalized == ".") rootFile else File(rootFile, normalized).canonicalFile
         val rootPath = rootFile.path
         val targetPath = target.path
@@ -200,12 +228,29 @@ class WorkspaceFileSystem(
         updatedAt = lastModified(),
     )
 
+    // 读取失败 (如断开的符号链接) 时返回 null, 与 File.isDirectory/length() 的失败语义一致
+    private fun File.readAttributes(): BasicFileAttributes? =
+        runCatching { Files.readAttributes(toPath(), BasicFileAttributes::class.java) }.getOrNull()
+
+    private fun File.toEntry(canonicalRoot: File, attrs: BasicFileAttributes?): WorkspaceFileEntry = WorkspaceFileEntry(
+        path = canonicalRelativePath(canonicalRoot),
+        name = name,
+        isDirectory = attrs?.isDirectory == true,
+        sizeBytes = if (attrs?.isRegularFile == true) attrs.size() else 0L,
+        updatedAt = attrs?.lastModifiedTime()?.toMillis() ?: 0L,
+    )
+
     private fun File.relativePath(root: File): String {
         val rootCanonical = root.canonicalFile
         val parentCanonical = (parentFile ?: rootCanonical).canonicalFile
         return File(parentCanonical, name).relativeTo(rootCanonical).path.replace(File.separatorChar, '/')
     }
 
+    // 调用方保证 root 与当前文件的父目录均已规范化 (来自 resolvePath 的目录或 Files.walk),
+    // 此时纯字符串计算即可, 省去 relativePath 里逐条目的两次 canonicalFile
+    private fun File.canonicalRelativePath(canonicalRoot: File): String =
+        relativeTo(canonicalRoot).path.replace(File.separatorChar, '/')
+
     private fun Path.normalizeForMatch(): Path =
         FileSystems.getDefault().getPath(relativeToString())
 
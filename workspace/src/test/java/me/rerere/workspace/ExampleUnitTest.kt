@@ -26,6 +26,42 @@ class ExampleUnitTest {
         )
     }
 
+    @Test
+    fun listPutsDirectoriesFirstWithFileMetadata() {
+        val root = Files.createTempDirectory("workspace-test").toFile()
+        val fileSystem = WorkspaceFileSystem()
+
+        fileSystem.writeText(root, "b.txt", "hello")
+        fileSystem.writeText(root, "A/inner.txt", "inner")
+        fileSystem.writeText(root, "a.txt", "")
+
+        val entries = fileSystem.list(root)
+        assertEquals(listOf("A", "a.txt", "b.txt"), entries.map { it.path })
+        assertTrue(entries[0].isDirectory)
+        assertEquals(0L, entries[0].sizeBytes)
+        assertEquals(5L, entries[2].sizeBytes)
+    }
+
+    @Test
+    fun globAndGrepRelativizeAgainstSymlinkedRoot() {
+        val base = Files.createTempDirectory("workspace-link-test").toFile()
+        val target = File(base, "data").apply { mkdirs() }
+        val root = File(base, "user")
+        Files.createSymbolicLink(root.toPath(), target.toPath())
+        val fileSystem = WorkspaceFileSystem()
+
+        fileSystem.writeText(root, "note.txt", "hello link")
+        fileSystem.writeText(root, "skip.md", "hello link")
+
+        val matches = fileSystem.glob(root, "*.txt")
+        assertEquals(listOf("note.txt"), matches.map { it.path })
+        assertEquals(10L, matches.single().sizeBytes)
+        assertEquals(
+            listOf(WorkspaceSearchMatch(path = "note.txt", line = 1, text = "hello link")),
+            fileSystem.grep(root, "hello", includeGlob = "*.txt"),
+        )
+    }
+
     @Test
     fun pathEscapeIsRejected() {
         val root = Files.createTempDirectory("workspace-test").toFile()